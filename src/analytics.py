@@ -0,0 +1,35 @@
+# Аналитика результатов по группе пользователей.
+# Вынесена из analyzer.py: здесь единственное место с числовыми
+# циклами, для которых оправдана векторизация NumPy.
+# Numba (@njit) сознательно не используется: холодный старт JIT
+# дороже, чем сам расчёт на массивах такого размера.
+import numpy as np
+
+
+def scores_summary(scores):
+    """Сводная статистика по массиву неотрицательных целых баллов.
+
+    Гистограмма разреженная: {балл: число пользователей}.
+    """
+    scores = np.asarray(scores)
+    if scores.ndim != 1:
+        raise ValueError("scores must be a 1-D sequence")
+    if scores.size == 0:
+        raise ValueError("scores must not be empty")
+    if not np.issubdtype(scores.dtype, np.integer):
+        raise ValueError("scores must be integers")
+    lo, hi = int(scores.min()), int(scores.max())
+    if lo < 0:
+        raise ValueError("scores must be non-negative")
+    values, counts = np.unique(scores, return_counts=True)
+    p25, p50, p75 = np.percentile(scores, [25, 50, 75])
+    return {
+        "count": int(scores.size),
+        "mean": float(scores.mean()),
+        "min": lo,
+        "max": hi,
+        "p25": float(p25),
+        "median": float(p50),
+        "p75": float(p75),
+        "histogram": dict(zip(values.tolist(), counts.tolist())),
+    }
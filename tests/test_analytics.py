@@ -0,0 +1,49 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from analytics import scores_summary  # noqa: E402
+
+
+def test_scores_summary():
+    summary = scores_summary(np.array([0, 10, 10, 20, 30]))
+    assert summary["count"] == 5
+    assert summary["mean"] == 14.0
+    assert summary["median"] == 10.0
+    assert summary["min"] == 0 and summary["max"] == 30
+    assert summary["histogram"] == {0: 1, 10: 2, 20: 1, 30: 1}
+
+
+def test_scores_summary_rejects_empty():
+    with pytest.raises(ValueError):
+        scores_summary([])
+
+
+def test_scores_summary_rejects_negative():
+    with pytest.raises(ValueError, match="non-negative"):
+        scores_summary([1, -2, 3])
+
+
+def test_scores_summary_rejects_non_integer():
+    with pytest.raises(ValueError, match="integers"):
+        scores_summary([1.9, 2.7])
+
+
+def test_scores_summary_rejects_2d():
+    with pytest.raises(ValueError, match="1-D"):
+        scores_summary([[1, 2], [3, 4]])
+
+
+def test_scores_summary_large_score_keeps_histogram_small():
+    summary = scores_summary(np.array([0, 2 ** 31 - 1, 3_000_000_000], dtype=np.int64))
+    assert summary["max"] == 3_000_000_000
+    assert summary["histogram"] == {0: 1, 2 ** 31 - 1: 1, 3_000_000_000: 1}
+
+
+def test_scores_summary_rejects_oversized_python_int():
+    with pytest.raises(ValueError, match="integers"):
+        scores_summary([2 ** 70])